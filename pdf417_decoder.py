@@ -1,13 +1,38 @@
 import json
 import re
-import argparse
+import glob
+import hashlib
 import logging
-from typing import Dict, Optional, List
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+from itertools import repeat
+from typing import Dict, Optional, List, Pattern, Tuple
 from pathlib import Path
 
-import pdf417gen
 from pyzxing import BarCodeReader
 
+# orjson is optional; the standard library json module is used without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# zxing-cpp (2.2+) decodes in-process with no JVM; pyzxing is used without it
+try:
+    import zxingcpp
+except ImportError:
+    zxingcpp = None
+
+# Older zxing-cpp releases lack TextMode and would escape the AAMVA header's
+# control characters, so they are treated as not installed
+if zxingcpp is not None and not hasattr(zxingcpp, "TextMode"):
+    zxingcpp = None
+
 # Configure logging with more robust settings
 logging.basicConfig(
     level=logging.INFO, 
@@ -55,6 +80,19 @@ FULL_FIELDS: Dict[str, str] = {
     "ZVZ": "SecurityData"
 }
 
+_VALID_CODES = frozenset(FULL_FIELDS)
+# Subfile designators that open the data section of a DL or ID card
+_SUBFILE_TYPES = ("DL", "ID")
+_NAME_TO_CODE: Dict[str, str] = {name: code for code, name in FULL_FIELDS.items()}
+
+# The header line carries the first element straight after the subfile
+# designator (e.g. "...DLDAQ123"), so lines that don't open with a code are
+# scanned with one alternation over every known code. The lookahead lets
+# each offset be tried, the same as a plain search per code.
+_FIELD_PATTERN: Pattern[str] = re.compile(
+    r"(?=(?P<code>" + "|".join(map(re.escape, FULL_FIELDS)) + r")([^\n\r]+))"
+)
+
 def parse_aamva(data: str, fields: Dict[str, str]) -> Dict[str, str]:
     """
     Extract selected fields from the AAMVA barcode with improved error handling.
@@ -68,17 +106,113 @@ def parse_aamva(data: str, fields: Dict[str, str]) -> Dict[str, str]:
     """
     try:
         parsed_data = {}
-        for key, name in fields.items():
-            match = re.search(rf"{key}([^\n\r]+)", data)
-            if match:
-                value = match.group(1).strip()
-                # Optional: Add basic validation or cleaning
-                parsed_data[name] = value
+        get_name = fields.get
+        for line in data.splitlines():
+            code = line[:3]
+            # A subfile that starts on its own line has its designator glued
+            # to the first element ("DLDAQ..."), and "DLD" is itself a code,
+            # so such lines are scanned like the header line
+            subfile_start = line.startswith(_SUBFILE_TYPES) and line[2:5] in _VALID_CODES
+            name = None if subfile_start else get_name(code)
+            if name is not None:
+                # Keep the first occurrence of each field
+                if name not in parsed_data:
+                    parsed_data[name] = line[3:].strip()
+            elif subfile_start or code not in _VALID_CODES:
+                for match in _FIELD_PATTERN.finditer(line):
+                    name = get_name(match.group("code"))
+                    if name is not None and name not in parsed_data:
+                        parsed_data[name] = match.group(2).strip()
+            else:
+                continue
+
+            # Nothing left to look for once every requested field is filled
+            if len(parsed_data) == len(fields):
+                break
         return parsed_data
     except Exception as e:
         logger.error(f"Error parsing AAMVA data: {e}")
         return {}
 
+_reader: Optional[BarCodeReader] = None
+_reader_lock = threading.Lock()
+
+def _get_reader() -> BarCodeReader:
+    """Build the ZXing reader once and share it across decodes."""
+    global _reader
+    if _reader is None:
+        # Parallel decodes must not race to fetch the ZXing jar
+        with _reader_lock:
+            if _reader is None:
+                _reader = BarCodeReader()
+    return _reader
+
+# PDF417_EAGER=1 prepares the pyzxing reader (and fetches its jar if
+# needed) at import, keeping that cost out of the first decode
+if os.environ.get("PDF417_EAGER") == "1" and zxingcpp is None:
+    try:
+        _get_reader()
+    except Exception as e:
+        logger.warning(f"Could not preload barcode reader: {e}")
+
+def _read_with_zxingcpp(image_path: str, content: bytes) -> List[Dict]:
+    """Decode PDF417 symbols with zxing-cpp, shaped like pyzxing's results."""
+    from PIL import Image
+
+    with Image.open(BytesIO(content)) as image:
+        # AAMVA payloads start with control characters ("@\n\x1e\r"), which
+        # the default HRI text mode would escape as "<LF><RS><CR>"
+        barcodes = zxingcpp.read_barcodes(
+            image,
+            formats=zxingcpp.BarcodeFormat.PDF417,
+            text_mode=zxingcpp.TextMode.Plain
+        )
+
+    results = []
+    for barcode in barcodes:
+        position = barcode.position
+        corners = (position.top_left, position.top_right, position.bottom_right, position.bottom_left)
+        results.append({
+            "filename": image_path,
+            "format": barcode.format.name,
+            "raw": barcode.text,
+            "parsed": barcode.text,
+            "points": [(float(point.x), float(point.y)) for point in corners]
+        })
+    return results
+
+# Backend results for recently decoded images, keyed by path and a hash of
+# the file contents so retried decodes skip the decoder unless the file
+# changed. The path is part of the key because results carry the filename.
+_DECODE_CACHE_SIZE = 256
+_decode_cache: "OrderedDict[Tuple[str, bytes], List[Dict]]" = OrderedDict()
+_decode_cache_lock = threading.Lock()
+
+def _read_barcodes(image_path: str) -> List[Dict]:
+    """Decode every barcode in an image, reusing results for unchanged files."""
+    # Reading the file is also the existence check
+    content = Path(image_path).read_bytes()
+    key = (image_path, hashlib.blake2b(content, digest_size=16).digest())
+    with _decode_cache_lock:
+        cached = _decode_cache.get(key)
+        if cached is not None:
+            _decode_cache.move_to_end(key)
+            return cached
+
+    if zxingcpp is not None:
+        results = _read_with_zxingcpp(image_path, content)
+    else:
+        # pyzxing globs its argument, so escape it to read exactly this file
+        results = _get_reader().decode(glob.escape(image_path))
+
+    # pyzxing reports Java failures as an empty list, so never cache misses
+    if results:
+        with _decode_cache_lock:
+            _decode_cache[key] = results
+            if len(_decode_cache) > _DECODE_CACHE_SIZE:
+                _decode_cache.popitem(last=False)
+    return results
+
 def decode_barcode(image_path: str, mode: str) -> Optional[Dict]:
     """
     Decode PDF417 barcode with enhanced error handling and logging.
@@ -91,20 +225,12 @@ def decode_barcode(image_path: str, mode: str) -> Optional[Dict]:
         Optional[Dict]: Decoded barcode data or None
     """
     try:
-        # Validate image path
-        if not Path(image_path).is_file():
-            logger.error(f"Image file not found: {image_path}")
-            return None
-
-        reader = BarCodeReader()
-        results = reader.decode(image_path)
+        results = _read_barcodes(image_path)
 
         if not results:
             logger.warning("No barcode detected in the image.")
             return None
 
-        raw_text = results[0].get("parsed", b"").decode("utf-8")
-
         # Dynamic result processing based on mode
         if mode == "raw":
             # Convert byte-based results to a JSON-serializable format
@@ -114,15 +240,126 @@ def decode_barcode(image_path: str, mode: str) -> Optional[Dict]:
                     for result in results
                 ]
             }
-        elif mode == "simple":
+
+        # Only the AAMVA modes need the parsed payload as text
+        raw_text = results[0].get("parsed", b"")
+        if isinstance(raw_text, bytes):
+            raw_text = raw_text.decode("utf-8")
+        if mode == "simple":
             return parse_aamva(raw_text, SIMPLE_FIELDS)
         elif mode == "full":
             return parse_aamva(raw_text, FULL_FIELDS)
         
+    # A directory used to fail the is_file() check, so report it the same way
+    except (FileNotFoundError, IsADirectoryError):
+        logger.error(f"Image file not found: {image_path}")
+        return None
     except Exception as e:
         logger.error(f"Barcode decoding error: {e}")
         return None
 
+def decode_batch(image_paths: List[str], mode: str, jobs: int = 1) -> Dict[str, Optional[Dict]]:
+    """
+    Decode several barcode images, sharing one reader across the batch.
+    
+    Args:
+        image_paths (List[str]): Paths to the barcode images
+        mode (str): Decoding mode (raw, simple, full)
+        jobs (int): Number of images to decode concurrently
+    
+    Returns:
+        Dict[str, Optional[Dict]]: Decoded data (or None) keyed by image path,
+        with each distinct path decoded once, in first-seen order
+    """
+    # Results are keyed by path, so repeated paths are dropped up front
+    # rather than decoded again and silently overwriting earlier entries
+    image_paths = list(dict.fromkeys(image_paths))
+
+    if jobs <= 1 or len(image_paths) <= 1:
+        return {image_path: decode_barcode(image_path, mode) for image_path in image_paths}
+
+    # A pyzxing decode blocks on its own Java subprocess, so threads are
+    # enough to keep several decoders running across cores at once
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        results = executor.map(decode_barcode, image_paths, repeat(mode, len(image_paths)))
+        return dict(zip(image_paths, results))
+
+def _load_json(raw: bytes):
+    """Parse JSON bytes, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _write_json(obj) -> None:
+    """Write obj to stdout as indented JSON, using orjson when it is available."""
+    if orjson is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        sys.stdout.buffer.flush()
+    else:
+        # orjson only indents by two spaces, so match it here
+        json.dump(obj, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
+
+# Blank margin around rendered barcodes, matching pdf417gen's default padding
+_QUIET_ZONE = 20
+
+# Output formats known to store the renderer's palette image as-is; the
+# rest get the RGB image pdf417gen used to produce
+_PALETTE_FORMATS = frozenset({"PNG", "GIF", "BMP", "TIFF", "WEBP"})
+
+# Identical payloads and options (common when generating from templates)
+# reuse the Reed-Solomon encode and rasterization from an earlier call
+@lru_cache(maxsize=128)
+def _encode_barcode(aamva_data: str, columns: int, security: int) -> Tuple[Tuple[int, ...], ...]:
+    """Encode AAMVA text into an immutable PDF417 codeword matrix."""
+    # pdf417gen pulls in PIL, so only load it when generating
+    import pdf417gen
+
+    codes = pdf417gen.encode(aamva_data, columns=columns, security_level=security)
+    return tuple(tuple(row) for row in codes)
+
+@lru_cache(maxsize=32)
+def _render_barcode(
+    barcode: Tuple[Tuple[int, ...], ...],
+    scale: int,
+    ratio: int,
+    fg_color: str,
+    bg_color: str
+):
+    """Rasterize a codeword matrix; callers must not modify the returned image."""
+    # Same pixels as pdf417gen.render_image, but the module grid is built
+    # with array operations and handed to PIL as a single buffer instead of
+    # being written one pixel at a time
+    import numpy as np
+    from PIL import Image, ImageColor, ImageOps
+
+    codes = np.array(barcode, dtype=np.uint32)
+    rows = len(codes)
+    # Codewords are 17 modules wide; the trailing stop pattern has 18
+    body = (codes[:, :-1, None] >> np.arange(16, -1, -1, dtype=np.uint32)) & 1
+    stop = (codes[:, -1:, None] >> np.arange(17, -1, -1, dtype=np.uint32)) & 1
+    modules = np.concatenate((body.reshape(rows, -1), stop.reshape(rows, -1)), axis=1)
+
+    # Index 0 is the background and 1 the bars. Keeping the image as a
+    # two-colour palette (rather than RGB) lets PNG store it at one bit
+    # per pixel.
+    image = Image.fromarray(modules.astype(np.uint8))
+    width, height = image.size
+    image = image.resize((scale * width, scale * height * ratio), resample=Image.Resampling.NEAREST)
+    image = ImageOps.expand(image, _QUIET_ZONE, 0)
+    image.putpalette(ImageColor.getrgb(bg_color)[:3] + ImageColor.getrgb(fg_color)[:3])
+    return image
+
+def _output_image(image, output_path: str):
+    """Return image in a mode the format chosen by output_path can store."""
+    from PIL import Image
+
+    output_format = Image.registered_extensions().get(Path(output_path).suffix.lower())
+    if output_format in _PALETTE_FORMATS:
+        return image
+    return image.convert("RGB")
+
 def generate_barcode(
     json_path: str, 
     output_path: str, 
@@ -145,8 +382,8 @@ def generate_barcode(
         bool: Success status of barcode generation
     """
     try:
-        with open(json_path, "r", encoding="utf-8") as file:
-            data = json.load(file)
+        with open(json_path, "rb") as file:
+            data = _load_json(file.read())
         
         # Validate required fields
         missing_fields = [field for field in FULL_FIELDS.values() if field not in data]
@@ -155,42 +392,80 @@ def generate_barcode(
         
         # Convert JSON to AAMVA-formatted string
         aamva_data = "\n".join(
-            f"{code}{data[field]}" 
-            for code, field in FULL_FIELDS.items() 
-            if field in data
+            f"{_NAME_TO_CODE[field]}{value}"
+            for field, value in data.items()
+            if field in _NAME_TO_CODE
         )
 
         # Generate PDF417 barcode with custom options
-        barcode = pdf417gen.encode(
-            aamva_data, 
-            columns=columns, 
-            security_level=security
-        )
-        image = pdf417gen.render_image(
-            barcode, 
-            scale=scale, 
-            ratio=ratio, 
-            fg_color=fg_color, 
-            bg_color=bg_color
-        )
-        image.save(output_path)
+        barcode = _encode_barcode(aamva_data, columns, security)
+        image = _render_barcode(barcode, scale, ratio, fg_color, bg_color)
+        _output_image(image, output_path).save(output_path)
         
         logger.info(f"Barcode saved as {output_path}")
         return True
     
-    except json.JSONDecodeError:
+    # orjson's JSONDecodeError subclasses json's; the json fallback reports
+    # non-UTF-8 input as a UnicodeDecodeError instead
+    except (json.JSONDecodeError, UnicodeDecodeError):
         logger.error(f"Invalid JSON file: {json_path}")
     except Exception as e:
         logger.error(f"Barcode generation error: {e}")
     
     return False
 
+# Decoding flags accepted by the argparse-free fast path in main()
+_MODE_FLAGS: Dict[str, str] = {
+    "-s": "simple", "--simple": "simple",
+    "-f": "full", "--full": "full",
+    "-r": "raw", "--raw": "raw"
+}
+
+def _run_fast_path(argv: List[str]) -> bool:
+    """
+    Handle the plain "<mode flag> <image>" and "-g <json>" invocations
+    without building the argparse parser.
+    
+    Args:
+        argv (List[str]): Command-line arguments, without the program name
+    
+    Returns:
+        bool: True if the invocation was handled
+    """
+    if len(argv) != 2:
+        return False
+
+    flag, value = argv
+    # The mode flag may also follow the image path
+    if value in _MODE_FLAGS:
+        flag, value = value, flag
+    # Options, and patterns that need glob expansion, go through argparse
+    if value.startswith("-") or any(char in value for char in "*?["):
+        return False
+
+    if flag in ("-g", "--generate"):
+        result = generate_barcode(value, "barcode.png")
+        print("Barcode generation successful" if result else "Barcode generation failed")
+        return True
+    if flag in _MODE_FLAGS:
+        result = decode_barcode(value, _MODE_FLAGS[flag])
+        if result:
+            _write_json(result)
+        return True
+    return False
+
 def main():
+    if _run_fast_path(sys.argv[1:]):
+        return
+
+    # Only the CLI needs argparse; library imports skip loading it
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Decode or generate PDF417 barcode based on AAMVA format."
     )
     group = parser.add_mutually_exclusive_group(required=True)
-    group.add_argument("image", nargs="?", help="Path to the barcode image")
+    group.add_argument("image", nargs="*", default=[], help="Path(s) or glob pattern(s) of the barcode image(s)")
     group.add_argument("-g", "--generate", metavar="JSON_FILE", help="Generate a PDF417 barcode from a JSON file")
 
     parser.add_argument("-o", "--output", metavar="OUTPUT_FILE", default="barcode.png", help="Output file for generated barcode (default: barcode.png)")
@@ -199,6 +474,7 @@ def main():
     parser.add_argument("-s", "--simple", action="store_true", help="Decode and display key readable fields")
     parser.add_argument("-f", "--full", action="store_true", help="Decode and display all readable fields")
     parser.add_argument("-r", "--raw", action="store_true", help="Display raw barcode output")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Number of images to decode in parallel (default: 1, 0: one per CPU)")
     
     # Barcode generation customization
     parser.add_argument("--columns", type=int, default=10, choices=range(1, 31), help="Number of columns (default: 10, range: 1-30)")
@@ -228,9 +504,27 @@ def main():
         else:
             parser.error("Decoding mode (-s, -f, or -r) is required when decoding a barcode.")
 
-        result = decode_barcode(args.image, mode)
+        # Expand glob patterns for shells that don't. Existing paths are
+        # taken literally (a file may be named "scan[1].png"), and patterns
+        # that match nothing are kept so they are reported as missing files.
+        image_paths = []
+        expanded = False
+        for pattern in args.image:
+            if os.path.exists(pattern) or not glob.has_magic(pattern):
+                image_paths.append(pattern)
+            else:
+                image_paths.extend(sorted(glob.glob(pattern)) or [pattern])
+                expanded = True
+
+        # Output is keyed by path whenever several images could be involved,
+        # however many files a pattern happened to match
+        if len(args.image) == 1 and not expanded:
+            result = decode_barcode(image_paths[0], mode)
+        else:
+            jobs = args.jobs or os.cpu_count() or 1
+            result = decode_batch(image_paths, mode, jobs)
         if result:
-            print(json.dumps(result, indent=4, ensure_ascii=False))
+            _write_json(result)
 
 if __name__ == "__main__":
     main()